@@ -2,7 +2,8 @@ from setuptools import setup, find_packages
 
 setup(
     name="apressurvey",
-    packages=find_packages(),
+    package_dir={'': 'src'},
+    packages=find_packages('src'),
     include_package_data=True,
     version='0.0.1',
     description='TkInter GUI for ApRES Radar HTTP Control',
@@ -3,19 +3,126 @@ import apreshttp
 from apreshttp.base import NotFoundException
 # library for processing ApRES data
 import apyres
+from apressurvey.processing import rangeAxis, rangeProfile, rangeProfileDB
+import concurrent.futures
 import datetime
+import logging
+import matplotlib
 import matplotlib.pyplot as plt 
+from matplotlib.collections import LineCollection
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import (FigureCanvasTkAgg, NavigationToolbar2Tk)
 import numpy as np
 import os
 import pathlib
+import time
 import tkinter as tk
 import tkinter.filedialog as tkfiledlg
 import tkinter.messagebox as tkmsg
 import tkinter.simpledialog as tkdlg
 from tkinter import ttk
 
+logger = logging.getLogger(__name__)
+
+# Simplify dense chirp traces down to pixel resolution when rendering
+matplotlib.rcParams['path.simplify'] = True
+matplotlib.rcParams['path.simplify_threshold'] = 1.0
+matplotlib.rcParams['agg.path.chunksize'] = 10000
+
+def setXLim(ax, xlim):
+    """Set x-axis limits, only if changed to avoid invalidating axes
+
+    :param ax: axes to update
+    :type ax: matplotlib.axes.Axes
+    :param xlim: new (min, max) limits
+    :type xlim: tuple
+    """
+    if ax.get_xlim() != tuple(xlim):
+        ax.set_xlim(xlim)
+
+def autoscaleIfOutside(ax, scalex=True):
+    """Autoscale axes only if data lies outside current view limits
+
+    Limits are kept while new data still fits, so a blitted canvas can 
+    reuse its cached background rather than redrawing in full.
+
+    :param ax: axes to rescale, with data limits already updated
+    :type ax: matplotlib.axes.Axes
+    :param scalex: also check and rescale x-axis, defaults to True
+    :type scalex: bool, optional
+    """
+    bounds = [(ax.get_ylim(), ax.dataLim.intervaly)]
+    if scalex:
+        bounds.append((ax.get_xlim(), ax.dataLim.intervalx))
+    if any(min(data) < min(view) or max(data) > max(view) for view, data in bounds):
+        ax.autoscale_view(scalex=scalex)
+
+def updateLines(ax, lines, x, y):
+    """Update data of animated lines, recreating them if number changes
+
+    :param ax: axes containing lines
+    :type ax: matplotlib.axes.Axes
+    :param lines: existing lines
+    :type lines: list
+    :param x: x data shared by all lines
+    :type x: numpy.ndarray
+    :param y: y data, one row per line
+    :type y: numpy.ndarray
+    :return: updated lines
+    :rtype: list
+    """
+    if len(lines) != len(y):
+        for line in lines:
+            line.remove()
+        ax.set_prop_cycle(None)
+        # Disable autoscaling while adding lines, callers rescale once
+        # after all data is updated
+        autoscale = (ax.get_autoscalex_on(), ax.get_autoscaley_on())
+        ax.set_autoscale_on(False)
+        lines = [ax.plot([], [], animated=True)[0] for row in y]
+        ax.set_autoscalex_on(autoscale[0])
+        ax.set_autoscaley_on(autoscale[1])
+
+    for line, row in zip(lines, y):
+        line.set_data(x, row)
+
+    return lines
+
+def updateCollection(ax, collection, x, y):
+    """Update data of animated line collection, creating it if needed
+
+    Each row of y is drawn as a line against x, all within a single 
+    artist.  Collections are not included by Axes.relim, so the data 
+    limits of the axes are reset to the new data.
+
+    :param ax: axes containing collection
+    :type ax: matplotlib.axes.Axes
+    :param collection: existing collection, or None to create
+    :type collection: matplotlib.collections.LineCollection or None
+    :param x: x data shared by all lines
+    :type x: numpy.ndarray
+    :param y: y data, one row per line
+    :type y: numpy.ndarray
+    :return: updated collection
+    :rtype: matplotlib.collections.LineCollection
+    """
+    segments = np.stack(np.broadcast_arrays(x, y), axis=-1)
+
+    if collection is None:
+        collection = LineCollection(
+            segments,
+            colors=matplotlib.rcParams['axes.prop_cycle'].by_key()['color'],
+            animated=True
+        )
+        ax.add_collection(collection)
+    else:
+        collection.set_segments(segments)
+
+    ax.ignore_existing_data_limits = True
+    ax.update_datalim([(np.min(x), np.min(y)), (np.max(x), np.max(y))])
+
+    return collection
+
 class ApplicationReference:
     """
     Interface class to store reference to top level application instance.
@@ -70,19 +177,35 @@ class DatetimeVar(tk.StringVar):
     DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 
     def __init__(self, value=None, *args, **kwargs):
-        if "value" != None:
-            if isinstance(kwargs, datetime.datetime):
-                self.datetime = kwargs["value"]
-                kwargs["value"] = kwargs["value"].strftime(self.DATETIME_FORMAT)
-            elif isinstance(kwargs, str):
-                self.datetime = datetime.datetime.strptime(kwargs["value"], self.DATETIME_FORMAT)
+        if value is not None:
+            if isinstance(value, datetime.datetime):
+                self.datetime = value
+            elif isinstance(value, str):
+                self.datetime = self.parse(value)
             else:
-                ValueError("value should be set to a datetime object or string.")
+                raise ValueError("value should be set to a datetime object or string.")
         else:
             self.datetime = datetime.datetime.now()
-            kwargs["value"] = self.datetime.strftime(self.DATETIME_FORMAT)
 
-        super().__init__(*args, **kwargs)
+        # Cache formatted string of current datetime
+        self.cachedDatetime = self.datetime
+        self.cachedString = self.datetime.strftime(self.DATETIME_FORMAT)
+
+        super().__init__(*args, value=self.cachedString, **kwargs)
+
+    @staticmethod
+    def parse(value):
+        """Parse string in DATETIME_FORMAT to datetime
+
+        Uses datetime.fromisoformat, which accepts DATETIME_FORMAT and is
+        considerably faster than datetime.strptime.
+
+        :param value: datetime string
+        :type value: str
+        :return: parsed datetime
+        :rtype: datetime.datetime
+        """
+        return datetime.datetime.fromisoformat(value)
 
     def get(self):
         """Returns datetime value as string
@@ -92,8 +215,10 @@ class DatetimeVar(tk.StringVar):
         """
         if self.datetime == None:
             return datetime.datetime.now().strftime(self.DATETIME_FORMAT)
-        else:
-            return self.datetime.strftime(self.DATETIME_FORMAT)
+        elif self.datetime is not self.cachedDatetime:
+            self.cachedDatetime = self.datetime
+            self.cachedString = self.datetime.strftime(self.DATETIME_FORMAT)
+        return self.cachedString
 
     def set(self, value):
         """Update value from string or datetime object
@@ -103,14 +228,74 @@ class DatetimeVar(tk.StringVar):
         :raises ValueError: value argument is not str or datetime.datetime
         """
         if isinstance(value, datetime.datetime):
-            self.datetime = datetime
-            super().set(value.strftime(self.DATETIME_FORMAT))
+            self.datetime = value
+            self.cachedDatetime = value
+            self.cachedString = value.strftime(self.DATETIME_FORMAT)
+            super().set(self.cachedString)
         elif isinstance(value, str):
-            self.datetime = datetime.datetime.strptime(value, self.DATETIME_FORMAT)
+            self.datetime = self.parse(value)
+            self.cachedDatetime = self.datetime
+            self.cachedString = value
             super().set(value)
         else:
             raise ValueError("Input to set should be a datetime object.")
 
+class BlitFigureCanvas(FigureCanvasTkAgg):
+    """
+    Subclass of FigureCanvasTkAgg which redraws animated artists by blitting
+
+    The figure background (i.e. everything except animated artists) is 
+    cached after each full draw.  Animated artists can then be redrawn over 
+    the cached background, provided the axes limits have not changed since.
+    """
+
+    def __init__(self, figure, master=None):
+        """Creates instance of BlitFigureCanvas
+
+        :param figure: figure to draw
+        :type figure: matplotlib.figure.Figure
+        :param master: parent widget, defaults to None
+        :type master: tkinter.Widget, optional
+        """
+        super().__init__(figure, master=master)
+        self.background = None
+        self.backgroundLimits = None
+        self.mpl_connect('draw_event', self.onDraw)
+
+    def getLimits(self):
+        return [(ax.get_xlim(), ax.get_ylim()) for ax in self.figure.axes]
+
+    def onDraw(self, event):
+        """Cache background and limits after a full draw
+
+        :param event: matplotlib draw event
+        :type event: matplotlib.backend_bases.DrawEvent
+        """
+        self.background = self.copy_from_bbox(self.figure.bbox)
+        self.backgroundLimits = self.getLimits()
+        self.drawAnimated()
+
+    def drawAnimated(self):
+        for ax in self.figure.axes:
+            for artist in ax.get_children():
+                if artist.get_animated():
+                    ax.draw_artist(artist)
+
+    def redraw(self, full=False):
+        """Redraw figure, blitting animated artists where possible
+
+        :param full: force full redraw (e.g. if static artists have changed),
+            defaults to False
+        :type full: bool, optional
+        """
+        if full or self.background is None or self.backgroundLimits != self.getLimits():
+            # Deferred until idle, so repeated requests result in one draw
+            self.draw_idle()
+        else:
+            self.restore_region(self.background)
+            self.drawAnimated()
+            self.blit(self.figure.bbox)
+
 class StatusFrame(tk.LabelFrame, ApplicationReference):
     """
     Subclass of LabelFrame to display ApRES status
@@ -128,6 +313,13 @@ class StatusFrame(tk.LabelFrame, ApplicationReference):
 
     BATTERY_LOG_SIZE = 256
     BATTERY_LOG_INTERVAL = 5000
+    BATTERY_VOLTAGE_MAX = 15
+    # Battery graph margins (px) around axes
+    BATTERY_CANVAS_MARGIN = 8
+    BATTERY_CANVAS_MARGIN_LEFT = 24
+    BATTERY_CANVAS_MARGIN_BOTTOM = 18
+    # Rows of status tree, in display order
+    STATUS_FIELDS = ("Time VAB", "Time GPS", "Battery Voltage", "Latitude", "Longitude")
     
     def __init__(self, parent, app=None, *args, **kwargs):
         """Creates instance of the StatusFrame class.
@@ -146,8 +338,19 @@ class StatusFrame(tk.LabelFrame, ApplicationReference):
         self.statusTree.heading('field', text='Field')
         self.statusTree.heading('value', text='Value')
 
-        # Create empty array to store battery values
-        self.batteryLog = np.zeros(self.BATTERY_LOG_SIZE)
+        # Create status rows once, values are updated in place
+        self.statusRowIds = {
+            field : self.statusTree.insert("", tk.END, values=(field, ""))
+            for field in self.STATUS_FIELDS
+        }
+
+        # Create empty circular buffer to store battery values, with index
+        # of the next (i.e. oldest) sample to overwrite.  Size must be a 
+        # power of two so the index can wrap with a bitmask
+        assert self.BATTERY_LOG_SIZE & (self.BATTERY_LOG_SIZE - 1) == 0, \
+            "BATTERY_LOG_SIZE must be a power of two"
+        self.batteryLog = np.zeros(self.BATTERY_LOG_SIZE, dtype=np.float32)
+        self.batteryLogIndex = 0
 
         # Get current datetime for default status method
         now = datetime.datetime.now().strftime(DatetimeVar.DATETIME_FORMAT)
@@ -164,13 +367,25 @@ class StatusFrame(tk.LabelFrame, ApplicationReference):
                 0,      # Longitude
             )
 
-        # Assign battery figure and setup
-        self.batteryFigure = Figure(figsize=(4,1))
-        self.batteryFigureAx = self.batteryFigure.add_subplot(111)
-        self.batteryFigureCanvas = FigureCanvasTkAgg(self.batteryFigure, master=self)
-        self.batteryFigureCanvas.draw()
-        self.batteryFigureCanvas.get_tk_widget().grid(padx=8, pady=8, row=3, column=0, sticky=(tk.E + tk.N + tk.W + tk.S))
-        self.batteryFigure.patch.set_facecolor("#F0F0F0")
+        # Assign battery graph, drawn directly onto a canvas as a single 
+        # polyline whose coordinates are updated on each log interval
+        self.batteryTimeAxis = np.linspace(
+            -self.BATTERY_LOG_INTERVAL*self.BATTERY_LOG_SIZE/1e3,
+            0,
+            self.BATTERY_LOG_SIZE
+        )
+        self.batteryCanvas = tk.Canvas(self, width=400, height=100, bg="#F0F0F0", highlightthickness=0)
+        self.batteryCanvas.grid(padx=8, pady=8, row=3, column=0, sticky=(tk.E + tk.N + tk.W + tk.S))
+        self.batteryLineId = self.batteryCanvas.create_line(0, 0, 0, 0, fill="blue")
+        # Axes are (re)drawn and line rescaled whenever the canvas is resized
+        self.batteryCanvasX = None
+        self.batteryCanvas.bind("<Configure>", self.batteryCanvasResized)
+
+        # Battery line is not redrawn while hidden or minimised, so catch up
+        # when either the canvas or the application window is remapped
+        self.batteryCanvasStale = False
+        self.batteryCanvas.bind("<Map>", self.batteryCanvasMapped, add="+")
+        self.winfo_toplevel().bind("<Map>", self.batteryCanvasMapped, add="+")
 
         # Create status label
         self.statusLabel = tk.StringVar(value="Not updated.")
@@ -186,44 +401,101 @@ class StatusFrame(tk.LabelFrame, ApplicationReference):
 
         # Start status update
         self.update()
-        # Start battery log update
-        self.batteryLogUpdate()
 
     def batteryLogUpdate(self):
         """
-        Replot battery log graph using most recent data.
+        Log latest battery voltage and replot battery log graph.
+
+        Called periodically by ApRESSystemFrame.tick every BATTERY_LOG_INTERVAL.
         """
 
-        print("Doing battery log update {:f}".format(self.status.batteryVoltage))
-        # Shift array back 1
-        self.batteryLog = np.roll(self.batteryLog, -1)
-        self.batteryLog[-1] = self.status.batteryVoltage
+        logger.debug("Doing battery log update %f", self.status.batteryVoltage)
+        # Overwrite oldest sample in circular buffer
+        self.batteryLog[self.batteryLogIndex] = self.status.batteryVoltage
+        self.batteryLogIndex = (self.batteryLogIndex + 1) & (self.BATTERY_LOG_SIZE - 1)
         
-        # Clear axis and plot
-        self.batteryFigureAx.clear()
-        self.batteryFigureAx.plot(
-            np.linspace(
-                -self.BATTERY_LOG_INTERVAL*self.BATTERY_LOG_SIZE/1e3,
-                0,
-                self.BATTERY_LOG_SIZE
-            ),
-            self.batteryLog
+        # Update line coordinates, skipping the redraw entirely if the 
+        # canvas is not currently viewable
+        if self.batteryCanvas.winfo_viewable():
+            self.batteryCanvasRedraw()
+        else:
+            self.batteryCanvasStale = True
+
+    def getBatteryLog(self):
+        """
+        Returns battery log in chronological order, oldest sample first.
+
+        :return: battery voltage samples
+        :rtype: numpy.ndarray
+        """
+        return np.concatenate((
+            self.batteryLog[self.batteryLogIndex:],
+            self.batteryLog[:self.batteryLogIndex]
+        ))
+
+    def batteryCanvasRedraw(self):
+        """
+        Update battery line coordinates from the battery log.
+        """
+        if self.batteryCanvasX is None:
+            return
+
+        y = self.batteryCanvasBottom - self.batteryCanvasScale * np.clip(
+            self.getBatteryLog(), 0, self.BATTERY_VOLTAGE_MAX
+        )
+        coords = np.column_stack((self.batteryCanvasX, y)).ravel()
+        self.batteryCanvas.coords(self.batteryLineId, coords.tolist())
+
+    def batteryCanvasResized(self, event):
+        """
+        Redraw battery graph axes and rescale line to new canvas size.
+
+        :param event: tkinter configure event
+        :type event: tkinter.Event
+        """
+        left, right = self.BATTERY_CANVAS_MARGIN_LEFT, event.width - self.BATTERY_CANVAS_MARGIN
+        top, bottom = self.BATTERY_CANVAS_MARGIN, event.height - self.BATTERY_CANVAS_MARGIN_BOTTOM
+
+        # Draw static axes box and labels
+        self.batteryCanvas.delete("axes")
+        self.batteryCanvas.create_rectangle(left, top, right, bottom, outline="black", tags="axes")
+        for voltage in range(0, self.BATTERY_VOLTAGE_MAX + 1, 5):
+            y = bottom - (bottom - top) * voltage / self.BATTERY_VOLTAGE_MAX
+            self.batteryCanvas.create_text(left - 4, y, text=str(voltage), anchor=tk.E, tags="axes")
+        self.batteryCanvas.create_text(left + 4, top + 2, text="Voltage (V)", anchor=tk.NW, tags="axes")
+        self.batteryCanvas.create_text(
+            left, bottom + 2, text="{:.0f}".format(self.batteryTimeAxis[0]), anchor=tk.NW, tags="axes"
+        )
+        self.batteryCanvas.create_text(right, bottom + 2, text="0", anchor=tk.NE, tags="axes")
+        self.batteryCanvas.create_text(
+            (left + right) / 2, bottom + 2, text="Time (s)", anchor=tk.N, tags="axes"
         )
-        self.batteryFigureAx.set_ylim(0, 15)
-        self.batteryFigureAx.set_ylabel('Voltage (V)')
-        self.batteryFigureCanvas.draw()
-        # Repeat again after logging interval
-        self.after(self.BATTERY_LOG_INTERVAL, self.batteryLogUpdate)
 
+        # Pixel coordinates of samples
+        self.batteryCanvasX = np.linspace(left, right, self.BATTERY_LOG_SIZE)
+        self.batteryCanvasBottom = bottom
+        self.batteryCanvasScale = (bottom - top) / self.BATTERY_VOLTAGE_MAX
+        self.batteryCanvasRedraw()
+
+    def batteryCanvasMapped(self, event):
+        """
+        Redraw battery line if samples were logged while it was hidden.
+
+        :param event: tkinter map event
+        :type event: tkinter.Event
+        """
+        # The toplevel binding also sees <Map> of every other child widget
+        if event.widget is not self.batteryCanvas \
+        and event.widget is not self.winfo_toplevel():
+            return
+        if self.batteryCanvasStale:
+            self.batteryCanvasStale = False
+            self.batteryCanvasRedraw()
 
     def update(self):
         """
         Update tree-view of housekeeping parameters with latest data
         """
-        
-        # Delete any existing children
-        for child in self.statusTree.get_children():
-            self.statusTree.delete(child)
 
         timeVAB = "[Not available]"
         if self.status.timeVAB != None:
@@ -233,11 +505,15 @@ class StatusFrame(tk.LabelFrame, ApplicationReference):
         if self.status.timeGPS != None:
             timeGPS = self.status.timeGPS.strftime(DatetimeVar.DATETIME_FORMAT)
         
-        self.statusTree.insert("", tk.END, values=("Time VAB", timeVAB))
-        self.statusTree.insert("", tk.END, values=("Time GPS", timeGPS))
-        self.statusTree.insert("", tk.END, values=("Battery Voltage", self.status.batteryVoltage))
-        self.statusTree.insert("", tk.END, values=("Latitude", self.status.latitude))
-        self.statusTree.insert("", tk.END, values=("Longitude", self.status.longitude))
+        # Only the value column changes, field labels are set once
+        for field, value in zip(self.STATUS_FIELDS, (
+            timeVAB,
+            timeGPS,
+            self.status.batteryVoltage,
+            self.status.latitude,
+            self.status.longitude
+        )):
+            self.statusTree.set(self.statusRowIds[field], 'value', value)
 
         self.statusLabel.set("Not connected.")
 
@@ -286,17 +562,11 @@ class ConfigFrame(tk.LabelFrame, ApplicationReference):
             )
             if len(filename) > 0:
 
-                overwrite = False
-                if os.path.exists(filename):
-                    overwrite = tkmsg.askyesno(title="File Exists", message="File already exists.  Overwrite?")
-
-                try:
-                    self.getAPI().system.housekeeping.config.download(filename, overwrite)
-                    self.application.systemFrame.setStatusLabel(
-                        "Successfully downloaded config to {:s}.".format(filename)
-                    )
-                except Exception as e:
-                    tkmsg.showerror(title=type(e).__name__, message=str(e))
+                # The save dialog has already confirmed any overwrite
+                future = self.application.ioExecutor.submit(
+                    self.getAPI().system.housekeeping.config.download, filename, True
+                )
+                self.application.whenDone(future, self.downloadConfigDone, filename)
 
             else:
                 tkmsg.showwarning(title="Empty Filename", message="No filename provided, not downloading config.ini.")
@@ -318,14 +588,10 @@ class ConfigFrame(tk.LabelFrame, ApplicationReference):
                 ]
             )
             if len(filename) > 0:
-                try:
-                    self.getAPI().system.housekeeping.config.upload(filename)
-                    self.application.systemFrame.setStatusLabel(
-                        "Successfully upload config to radar from {:s}.".format(filename)
-                    )
-                    tkmsg.showinfo(title="Uploaded Config.ini", message="You must reset the ApRES for the new config.ini to be applied.")
-                except Exception as e:
-                    tkmsg.showerror(title=type(e).__name__, message=str(e))
+                future = self.application.ioExecutor.submit(
+                    self.getAPI().system.housekeeping.config.upload, filename
+                )
+                self.application.whenDone(future, self.uploadConfigDone, filename)
 
             else:
                 tkmsg.showwarning(title="Empty Filename", message="No filename provided, not uploading config.ini.")
@@ -338,23 +604,46 @@ class ConfigFrame(tk.LabelFrame, ApplicationReference):
     def reset(self, *args):
         api = self.getAPI()
         if api != None:
-            try:
-                resetMessage = api.system.reset()
-                if resetMessage != None:
-                    self.application.systemFrame.setStatusLabel(
-                        "Attempting reset at {:s} [{:s}]".format(
-                            resetMessage.time.strftime(DatetimeVar.DATETIME_FORMAT),
-                            resetMessage.message
-                        )
-                    )
-            except Exception as e: 
-                tkmsg.showerror(title=type(e).__name__, message=str(e))
+            future = self.application.ioExecutor.submit(api.system.reset)
+            self.application.whenDone(future, self.resetDone)
         else:
             self.application.systemFrame.setStatusLabel(
                 "Error connecting to radar."
             )
             self.application.systemFrame.configure(bg="red")
 
+    def downloadConfigDone(self, future, filename):
+        try:
+            future.result()
+            self.application.systemFrame.setStatusLabel(
+                "Successfully downloaded config to {:s}.".format(filename)
+            )
+        except Exception as e:
+            tkmsg.showerror(title=type(e).__name__, message=str(e))
+
+    def uploadConfigDone(self, future, filename):
+        try:
+            future.result()
+            self.application.systemFrame.setStatusLabel(
+                "Successfully upload config to radar from {:s}.".format(filename)
+            )
+            tkmsg.showinfo(title="Uploaded Config.ini", message="You must reset the ApRES for the new config.ini to be applied.")
+        except Exception as e:
+            tkmsg.showerror(title=type(e).__name__, message=str(e))
+
+    def resetDone(self, future):
+        try:
+            resetMessage = future.result()
+            if resetMessage != None:
+                self.application.systemFrame.setStatusLabel(
+                    "Attempting reset at {:s} [{:s}]".format(
+                        resetMessage.time.strftime(DatetimeVar.DATETIME_FORMAT),
+                        resetMessage.message
+                    )
+                )
+        except Exception as e: 
+            tkmsg.showerror(title=type(e).__name__, message=str(e))
+
 class BurstConfigFrame(tk.LabelFrame, ApplicationReference):
 
     def __init__(self, parent, app=None, *args, **kwargs):
@@ -475,27 +764,40 @@ class BurstConfigFrame(tk.LabelFrame, ApplicationReference):
         else:
             try:
 
+                # Read values on the Tk thread, then send them to the radar
+                # on the I/O worker
                 nAttens = self.attenuatorsVariableFrame.getNthValue(0)
 
-                self.config = self.getAPI().radar.config.set(
+                future = self.application.ioExecutor.submit(
+                    self.getAPI().radar.config.set,
                     nAtts=nAttens,
                     nAverages=self.averageVariableFrame.getNthValue(0),
                     nBursts=self.subburstVariableFrame.getNthValue(0),
-                    rfAttnSet=[
-                        self.rfAttnVariableFrame.getNthValue(n) for n in range(nAttens)
-                    ],
-                    afGainSet=[
-                        self.afGainVariableFrame.getNthValue(n) for n in range(nAttens)
-                    ],
+                    rfAttnSet=self.rfAttnVariableFrame.getValues(nAttens),
+                    afGainSet=self.afGainVariableFrame.getValues(nAttens),
                     txAnt=self.txAntennaFrame.getValues(),
                     rxAnt=self.rxAntennaFrame.getValues()
                 )
+                self.application.whenDone(future, self.updateConfigDone)
 
             except Exception as e:
                 self.application.systemFrame.setStatusLabel("Error updating burst configuration from radar.")
                 tkmsg.showerror(title=type(e).__name__, message=str(e))
-    
-            self.refreshConfig()
+                self.refreshConfig()
+
+    def updateConfigDone(self, future):
+        """Refresh config entries once the config update completes
+
+        :param future: completed config update
+        :type future: concurrent.futures.Future
+        """
+        try:
+            self.config = future.result()
+        except Exception as e:
+            self.application.systemFrame.setStatusLabel("Error updating burst configuration from radar.")
+            tkmsg.showerror(title=type(e).__name__, message=str(e))
+
+        self.refreshConfig()
 
     def refreshConfig(self):
 
@@ -503,33 +805,42 @@ class BurstConfigFrame(tk.LabelFrame, ApplicationReference):
             tkmsg.showwarning(title="Not connected.", message="Config not refreshed.")
             self.getApplication().systemFrame.configure(bg="red")
         else:
-            try:
+            future = self.application.ioExecutor.submit(self.getAPI().radar.config.get)
+            self.application.whenDone(future, self.applyConfig)
 
-                self.config = self.getAPI().radar.config.get()
+    def applyConfig(self, future):
+        """Update config entries once the config request completes
 
-                # self.averageVariableFrame.status.set("[{:d}]".format(self.config.nAverages))
-                self.averageVariableFrame.setNthValue(0, self.config.nAverages)
+        :param future: completed config request
+        :type future: concurrent.futures.Future
+        """
+        try:
 
-                # self.subburstVariableFrame.status.set("[{:d}]".format(self.config.nSubBursts))
-                self.subburstVariableFrame.setNthValue(0, self.config.nSubBursts)
+            self.config = future.result()
 
-                # self.attenuatorsVariableFrame.status.set("[{:d}]".format(self.config.nAttenuators))
-                self.attenuatorsVariableFrame.setNthValue(0, self.config.nAttenuators)
+            # self.averageVariableFrame.status.set("[{:d}]".format(self.config.nAverages))
+            self.averageVariableFrame.setNthValue(0, self.config.nAverages)
 
-                # rfStr = "".join([str(rf)+"," for rf in self.config.rfAttn])
-                # self.rfAttnVariableFrame.status.set("[{:s}]".format(rfStr[:-1]))
+            # self.subburstVariableFrame.status.set("[{:d}]".format(self.config.nSubBursts))
+            self.subburstVariableFrame.setNthValue(0, self.config.nSubBursts)
 
-                # afStr = "".join([str(af)+"," for af in self.config.afGain])
-                # self.afGainVariableFrame.status.set("[{:s}]".format(afStr[:-1]))
+            # self.attenuatorsVariableFrame.status.set("[{:d}]".format(self.config.nAttenuators))
+            self.attenuatorsVariableFrame.setNthValue(0, self.config.nAttenuators)
 
-                self.txAntennaFrame.setValues(self.config.txAntenna)
-                self.rxAntennaFrame.setValues(self.config.rxAntenna)
+            # rfStr = ",".join(map(str, self.config.rfAttn))
+            # self.rfAttnVariableFrame.status.set("[{:s}]".format(rfStr))
 
-                self.updateAttenuators()
-                
-            except Exception as e:
-                self.application.systemFrame.setStatusLabel("Error retrieving burst configuration from radar.")
-                tkmsg.showerror(title=type(e).__name__, message=str(e))
+            # afStr = ",".join(map(str, self.config.afGain))
+            # self.afGainVariableFrame.status.set("[{:s}]".format(afStr))
+
+            self.txAntennaFrame.setValues(self.config.txAntenna)
+            self.rxAntennaFrame.setValues(self.config.rxAntenna)
+
+            self.updateAttenuators()
+            
+        except Exception as e:
+            self.application.systemFrame.setStatusLabel("Error retrieving burst configuration from radar.")
+            tkmsg.showerror(title=type(e).__name__, message=str(e))
     
     class ConfigVariableFrame:
 
@@ -551,21 +862,19 @@ class BurstConfigFrame(tk.LabelFrame, ApplicationReference):
             self.entry = []
             self.values = []
             for k in range(N):
-                print("adding {:d} element".format(k))
                 cValue = varClass()
                 cValue.set(varDefault)
                 cElement = entryClass(self.entryFrame, textvariable=cValue, **entryClassArgs)
                 self.entry.append(cElement)
                 self.values.append(cValue)
 
+            # Number of elements currently shown
+            self.visibleN = 0
             self.updateVisible(N)
                 
         def updateVisible(self, N):
 
-            print("Updating visible with {:d}".format(N))
-            # Hide all elements
-            for k in range(self.N):
-                self.entry[k].grid_remove()
+            logger.debug("Updating visible with %d", N)
 
             if N > self.N:
                 N = self.N
@@ -573,14 +882,28 @@ class BurstConfigFrame(tk.LabelFrame, ApplicationReference):
             if N < 1:
                 N = 1
 
-            for k in range(N):
-                print("Showing {:d}th element".format(k))
+            # Only show or hide elements which have changed
+            for k in range(self.visibleN, N):
                 self.entry[k].grid(row=0, column=k, sticky=(tk.E + tk.W))
 
+            for k in range(N, self.visibleN):
+                self.entry[k].grid_remove()
+
+            self.visibleN = N
+
         def getNthValue(self, n):
             return self.values[n].get()
 
+        def getValues(self, N):
+            return [value.get() for value in self.values[:N]]
+
         def setNthValue(self, n, val):
+            # Skip unchanged values to avoid firing variable traces
+            try:
+                if self.values[n].get() == val:
+                    return
+            except tk.TclError:
+                pass
             self.values[n].set(val)
 
     class AntennaCheckbuttonFrame(tk.Frame):
@@ -595,6 +918,8 @@ class BurstConfigFrame(tk.LabelFrame, ApplicationReference):
 
             self.checkboxes = []
             self.checkbox_values = []
+            # Checkbox states packed into single int, bit k is checkbox k
+            self.packed = 0
 
             for k in range(N):
                 chkbx_var = tk.IntVar()
@@ -608,18 +933,21 @@ class BurstConfigFrame(tk.LabelFrame, ApplicationReference):
             if len(values) != self.N:
                 raise ValueError("values must be an array of length {:d}".format(self.N))
             else:
-                for k in range(self.N):
-                    self.checkbox_values[k].set(values[k])
+                self.packed = 0
+                for k, (chkbox_val, value) in enumerate(zip(self.checkbox_values, map(int, values))):
+                    chkbox_val.set(value)
+                    self.packed |= (value != 0) << k
 
         def getValues(self):
-            values = []
-            for chkbox_val in self.checkbox_values:
-                values.append(chkbox_val.get())
-            return tuple(values)
+            return tuple((self.packed >> k) & 1 for k in range(self.N))
 
         def checkAtLeastOne(self):
-            if sum([chkbox_val.get() for chkbox_val in self.checkbox_values]) == 0:
+            self.packed = sum(
+                chkbox_val.get() << k for k, chkbox_val in enumerate(self.checkbox_values)
+            )
+            if self.packed == 0:
                 self.checkbox_values[0].set(1)
+                self.packed = 1
 
     # class MultipleFieldInput(tk.Frame):
         
@@ -642,10 +970,33 @@ class BurstConfigFrame(tk.LabelFrame, ApplicationReference):
         
 class ApRESSystemFrame(tk.Frame, ApplicationReference):
 
-    def __init__(self, parent, app=None, *args, **kwargs):
+    # Smoothing factor for exponential moving average of tick overhead
+    TICK_SMOOTHING = 0.2
+
+    def __init__(self, parent, app=None, *args, maxRedrawRate=10, **kwargs):
+        """Create instance of ApRESSystemFrame
+
+        :param parent: parent tkinter.Frame
+        :type parent: tkinter.Frame or tkinter.Tk
+        :param app: reference to top level application, defaults to None
+        :type app: ApRESSurveyApplication, optional
+        :param maxRedrawRate: maximum rate (Hz) of status updates, or None 
+            for no limit, defaults to 10
+        :type maxRedrawRate: float, optional
+        :raises ValueError: maxRedrawRate is not positive
+        """
+        if maxRedrawRate is not None and maxRedrawRate <= 0:
+            raise ValueError("maxRedrawRate should be positive or None.")
+
         ApplicationReference.__init__(self, app=app)
         tk.Frame.__init__(self, parent, *args, **kwargs)
 
+        # Limit rate of status updates, with time of last update and any 
+        # update deferred until the limit allows
+        self.maxRedrawRate = maxRedrawRate
+        self.lastStatusDraw = 0.0
+        self.deferredStatusUpdate = None
+
         self.radarAddress = tk.StringVar()
         radarAddressCombo = ttk.Combobox(
             self,
@@ -675,10 +1026,40 @@ class ApRESSystemFrame(tk.Frame, ApplicationReference):
         self.rowconfigure(2,weight=0)
         self.rowconfigure(3,weight=1)
 
+        # Reference to outstanding status request (if any)
+        self.statusRequest = None
+
+        # Start single periodic status and battery log update
+        self.statusPolling = False
+        self.tickOverhead = 0
+        self.tick()
+
+    def tick(self):
+        """
+        Periodically update radar status and battery log.
+
+        Status polling and battery logging share one timer, so each interval 
+        results in a single HTTP request and a single redraw.  The time spent 
+        in each tick is smoothed and subtracted from the next delay to limit 
+        drift of the logging interval.
+        """
+        tickStart = time.perf_counter()
+
+        if self.statusPolling:
+            self.updateStatus()
+        self.statusFrame.batteryLogUpdate()
+
+        # Update moving average of overhead and schedule next tick
+        interval = self.statusFrame.BATTERY_LOG_INTERVAL / 1e3
+        self.tickOverhead += self.TICK_SMOOTHING * (time.perf_counter() - tickStart - self.tickOverhead)
+        delay = interval - min(max(self.tickOverhead, 0), interval - 0.001)
+        self.after(int(delay * 1000), self.tick)
+
     def connectToRadar(self, *args):
         try:
             self.application.api = apreshttp.API(self.radarAddress.get())
             self.application.api.setKey("18052021")
+            self.statusPolling = True
             self.updateStatus()
             self.application.systemFrame.radarConfigFrame.refreshConfig()
             self.configure(bg = 'green')
@@ -692,20 +1073,58 @@ class ApRESSystemFrame(tk.Frame, ApplicationReference):
         self.statusFrame.statusLabel.set(text)
 
     def updateStatus(self, *args):
+        """
+        Request latest housekeeping status from the radar.
+
+        The request is made on a worker thread so a slow or unreachable radar
+        does not block the Tk event loop.  If a previous request is still
+        outstanding no new request is made.  Updates are limited to 
+        maxRedrawRate, with any update requested sooner deferred.
+        """
+        if self.statusRequest != None or self.deferredStatusUpdate != None:
+            return
+
+        remaining = 0
+        if self.maxRedrawRate is not None:
+            remaining = self.lastStatusDraw + 1 / self.maxRedrawRate - time.monotonic()
+        if remaining > 0:
+            self.deferredStatusUpdate = self.after(int(remaining * 1000) + 1, self.deferredUpdateStatus)
+            return
+
+        if self.getAPI() != None:
+            self.statusRequest = self.application.ioExecutor.submit(
+                self.getAPI().system.housekeeping.status
+            )
+            self.application.whenDone(self.statusRequest, self.applyStatus)
+        else:
+            self.statusPolling = False
+            self.setStatusLabel("Cannot connect to radar at {:s}.".format(
+                self.radarAddress.get()
+            ))
+
+    def deferredUpdateStatus(self):
+        self.deferredStatusUpdate = None
+        self.updateStatus()
+
+    def applyStatus(self, request):
+        """
+        Update status frame once the outstanding status request completes.
+
+        :param request: completed status request
+        :type request: concurrent.futures.Future
+        """
+        self.statusRequest = None
+        self.lastStatusDraw = time.monotonic()
+
         try:
-            if self.getAPI() != None:
-                self.statusFrame.status = self.getAPI().system.housekeeping.status()
-                self.statusFrame.update()
-                self.setStatusLabel("Updated from {:s} at {:s}.".format(
-                    self.radarAddress.get(),
-                    datetime.datetime.now().strftime(DatetimeVar.DATETIME_FORMAT)
-                ))
-                self.statusFrame.after(5000, self.updateStatus)
-            else:
-                self.setStatusLabel("Cannot connect to radar at {:s}.".format(
-                    self.radarAddress.get()
-                ))
+            self.statusFrame.status = request.result()
+            self.statusFrame.update()
+            self.setStatusLabel("Updated from {:s} at {:s}.".format(
+                self.radarAddress.get(),
+                datetime.datetime.now().strftime(DatetimeVar.DATETIME_FORMAT)
+            ))
         except Exception as e:
+            self.statusPolling = False
             self.statusFrame.statusLabel.set("Error connecting to radar.")
             self.application.systemFrame.configure(bg="red")
             tkmsg.showerror(title=type(e).__name__, message=str(e))
@@ -737,7 +1156,7 @@ class ApRESTrialBurstFrame(tk.Frame, ApplicationReference):
 
         ttk.Separator(self, orient="horizontal").grid(column=0, row=3, columnspan=5, padx=8, pady=8, sticky=(tk.E + tk.W))
         
-        self.trialFigure = Figure(figsize=(4,1.5))
+        self.trialFigure = Figure(figsize=(4,1.5), dpi=72)
         self.trialFigure.subplots_adjust(
             left=0.05,
             bottom=0.05, 
@@ -749,12 +1168,24 @@ class ApRESTrialBurstFrame(tk.Frame, ApplicationReference):
         
         self.trialFigureChirpAx = self.trialFigure.add_subplot(311)
         self.trialFigureChirpAx.set_title('Raw Chirp Data')
+        self.trialFigureChirpAx.set_xlabel("Time (s)")
+        self.trialFigureChirpAx.set_ylabel("Voltage (V)")
         self.trialFigureFFTAx = self.trialFigure.add_subplot(312)
-        self.trialFigureFFTAx.set_title('FFT Chirp Data')
+        self.trialFigureFFTAx.set_title('Chirp Range Data')
+        self.trialFigureFFTAx.set_xlabel("Range (m)")
+        self.trialFigureFFTAx.set_ylabel("Voltage (dBV)")
         self.trialFigureHistoAx = self.trialFigure.add_subplot(313)
         self.trialFigureHistoAx.set_title('Histograms')
-        self.trialFigureCanvas = FigureCanvasTkAgg(self.trialFigure, master=self)
-        self.trialFigureCanvas.draw()
+        self.trialFigureHistoAx.set_xlabel("Voltage (V)")
+        self.trialFigureHistoAx.set_ylabel("Count")
+        self.trialFigureCanvas = BlitFigureCanvas(self.trialFigure, master=self)
+        # Lines are created on first burst and then updated in place
+        self.trialChirpLines = []
+        self.trialFFTLines = []
+        self.trialHistoLines = []
+        self.trialHistoLabels = []
+        # Range profile magnitude buffer, reused between bursts
+        self.trialRangeDB = None
         self.trialFigureCanvas.get_tk_widget().grid(padx=8, pady=8, row=4, column=0, columnspan=5, sticky=(tk.E + tk.N + tk.W + tk.S))
         self.trialFigure.patch.set_facecolor("#F0F0F0")
         
@@ -783,60 +1214,60 @@ class ApRESTrialBurstFrame(tk.Frame, ApplicationReference):
 
     def updateBurstGraphs(self, results):
 
-        self.trialFigureChirpAx.clear()
-        self.trialFigureFFTAx.clear()
-        self.trialFigureHistoAx.clear()
-
-        fmcw_param = apyres.FMCWParameters(
-            fc = (results.stopFrequency + results.startFrequency) / 2,
-            B = (results.stopFrequency - results.startFrequency),
-            T = results.period
-        )
+        # Chirp bandwidth, the only FMCW parameter needed for the range axis
+        B = results.stopFrequency - results.startFrequency
 
-        for k in range(results.nAttenuators):
+        # Calculate range profiles for all attenuator settings in one call
+        chirps = np.ascontiguousarray(np.asarray(results.chirp, dtype=np.float32))
+        rp = rangeProfile(chirps)
 
-            # Create RangeProfile object for results
-            rp = apyres.RangeProfile.calculate_from_chirp([], np.array(results.chirp[k]), fmcw_param)
+        rangeAxis = self.chirpDataControls.getRangeAxis(B, rp.shape[-1])
+        self.trialRangeDB = rangeProfileDB(rp, self.trialRangeDB)
 
-            dR = 3e8/(2*fmcw_param.B*2*np.sqrt(self.chirpDataControls.erIceValue.get()))
+        # Update line data, lines are only recreated if the number of 
+        # attenuator settings changes
+        self.trialChirpLines = updateLines(
+            self.trialFigureChirpAx, self.trialChirpLines, np.arange(chirps.shape[-1]), chirps
+        )
+        self.trialFFTLines = updateLines(
+            self.trialFigureFFTAx, self.trialFFTLines, rangeAxis, self.trialRangeDB
+        )
+        self.trialHistoLines = updateLines(
+            self.trialFigureHistoAx, self.trialHistoLines, results.histogramVoltage, results.histogram
+        )
 
-            self.trialFigureChirpAx.plot(results.chirp[k])
-            self.trialFigureFFTAx.plot(
-                np.arange(0, dR*(rp.shape[1]), dR), 
-                20*np.log10(np.abs(rp[0,:])).transpose()
-            )
-            self.trialFigureHistoAx.plot(
-                results.histogramVoltage,
-                results.histogram[k],
-                label="AF={:d},RF={:2.2f}".format(results.afGain[k],results.rfAttn[k])
-            )
-            
-        self.trialFigureChirpAx.set_title('Raw Chirp Data')
-        self.trialFigureFFTAx.set_title('Range Data')
-        self.trialFigureHistoAx.set_title('Histograms')
-        self.trialFigureHistoAx.legend()
+        # Legend is part of the static background, so only update (and 
+        # force a full redraw) if the labels have changed
+        histoLabels = [
+            "AF={:d},RF={:2.2f}".format(results.afGain[k],results.rfAttn[k])
+            for k in range(results.nAttenuators)
+        ]
+        fullRedraw = histoLabels != self.trialHistoLabels
+        if fullRedraw:
+            self.trialHistoLabels = histoLabels
+            for line, label in zip(self.trialHistoLines, histoLabels):
+                line.set_label(label)
+            self.trialFigureHistoAx.legend()
+
+        # Only rescale if data no longer fits, x-limits of chirp and range
+        # axes are set from controls
+        for ax in (self.trialFigureChirpAx, self.trialFigureFFTAx, self.trialFigureHistoAx):
+            ax.relim()
+        autoscaleIfOutside(self.trialFigureChirpAx, scalex=False)
+        autoscaleIfOutside(self.trialFigureFFTAx, scalex=False)
+        autoscaleIfOutside(self.trialFigureHistoAx)
 
         # Set limits
-        self.trialFigureChirpAx.set_title('Raw Chirp Data')
-        self.trialFigureChirpAx.set_xlim([
-            self.chirpDataControls.timeMin.get(),
-            self.chirpDataControls.timeMax.get()
-        ])
-        self.trialFigureChirpAx.set_xlabel("Time (s)")
-        self.trialFigureChirpAx.set_ylabel("Voltage (V)")
-
-        self.trialFigureFFTAx.set_title('Chirp Range Data')
-        self.trialFigureFFTAx.set_xlim([
-            self.chirpDataControls.rangeMin.get(),
-            self.chirpDataControls.rangeMax.get()
-        ])
-        self.trialFigureFFTAx.set_xlabel("Range (m)")
-        self.trialFigureFFTAx.set_ylabel("Voltage (dBV)")
-
-        self.trialFigureHistoAx.set_xlabel("Voltage (V)")
-        self.trialFigureHistoAx.set_ylabel("Count")
-
-        self.trialFigureCanvas.draw()
+        setXLim(self.trialFigureChirpAx, (
+            self.chirpDataControls.timeMinCached,
+            self.chirpDataControls.timeMaxCached
+        ))
+        setXLim(self.trialFigureFFTAx, (
+            self.chirpDataControls.rangeMinCached,
+            self.chirpDataControls.rangeMaxCached
+        ))
+
+        self.trialFigureCanvas.redraw(full=fullRedraw)
         self.button['state'] = "normal"
 
 class ChirpDataControlFrame(tk.Frame):
@@ -899,6 +1330,56 @@ class ChirpDataControlFrame(tk.Frame):
         self.columnconfigure(4, weight=0)
         self.columnconfigure(5, weight=1)
 
+        # Keep plain float copies of values, updated whenever they are 
+        # edited, so plotting does not need to read them back from Tcl
+        for name, var in (
+            ("timeMinCached", self.timeMin), 
+            ("timeMaxCached", self.timeMax), 
+            ("rangeMinCached", self.rangeMin), 
+            ("rangeMaxCached", self.rangeMax), 
+            ("erIceCached", self.erIceValue)
+        ):
+            setattr(self, name, var.get())
+            var.trace_add('write', lambda *args, name=name, var=var: self.cacheValue(name, var))
+
+        # Cached range axis, recalculated if bandwidth, number of range bins
+        # or er_ice change
+        self.rangeAxisKey = None
+        self.rangeAxis = None
+        self.erIceValue.trace_add('write', self.invalidateRangeAxis)
+
+    def cacheValue(self, name, var):
+        """Update cached copy of variable value
+
+        :param name: attribute name of cached value
+        :type name: str
+        :param var: variable to read
+        :type var: tkinter.DoubleVar
+        """
+        try:
+            setattr(self, name, var.get())
+        except tk.TclError:
+            # Keep previous value while entry is invalid (e.g. mid-edit)
+            pass
+
+    def invalidateRangeAxis(self, *args):
+        self.rangeAxisKey = None
+
+    def getRangeAxis(self, B, N):
+        """Returns range axis in ice for a range profile
+
+        :param B: chirp bandwidth (Hz)
+        :type B: float
+        :param N: number of range bins
+        :type N: int
+        :return: range of each bin (m)
+        :rtype: numpy.ndarray
+        """
+        if self.rangeAxisKey != (B, N):
+            self.rangeAxis = rangeAxis(B, N, self.erIceCached)
+            self.rangeAxisKey = (B, N)
+        return self.rangeAxis
+
 class ApRESSingleBurstFrame(tk.Frame, ApplicationReference):
 
     def __init__(self, parent, app=None, *args, **kwargs):
@@ -921,7 +1402,7 @@ class ApRESSingleBurstFrame(tk.Frame, ApplicationReference):
         self.button = ttk.Button(self,text="Do Single Burst", command=self.do_burst)
         self.button.grid(row=1, column=0, columnspan=3, padx=8, pady=8, ipadx=8, ipady=8, sticky=(tk.N + tk.E + tk.S + tk.W))
 
-        self.dataFigure = Figure(figsize=(4,0.5))
+        self.dataFigure = Figure(figsize=(4,0.5), dpi=72)
         self.dataFigure.subplots_adjust(
             left=0.05,
             bottom=0.1, 
@@ -936,10 +1417,16 @@ class ApRESSingleBurstFrame(tk.Frame, ApplicationReference):
 
         self.dataFigureChirpAx = self.dataFigure.add_subplot(121)
         self.dataFigureChirpAx.set_title('Raw Chirp Data')
+        self.dataFigureChirpAx.set_xlabel("Time (s)")
+        self.dataFigureChirpAx.set_ylabel("Voltage (V)")
         self.dataFigureFFTAx = self.dataFigure.add_subplot(122)
         self.dataFigureFFTAx.set_title('Chirp Range Data')
-        self.dataFigureCanvas = FigureCanvasTkAgg(self.dataFigure, master=self)
-        self.dataFigureCanvas.draw()
+        self.dataFigureFFTAx.set_xlabel("Range (m)")
+        self.dataFigureFFTAx.set_ylabel("Voltage (dBV)")
+        self.dataFigureCanvas = BlitFigureCanvas(self.dataFigure, master=self)
+        # Line collections are created on first load and then updated in place
+        self.dataChirpCollection = None
+        self.dataFFTCollection = None
         self.dataFigureCanvas.get_tk_widget().grid(row=2, column=0, columnspan=3, padx=8, pady=8, sticky=(tk.E + tk.N + tk.W + tk.S))
         self.dataFigure.patch.set_facecolor("#F0F0F0")
 
@@ -950,6 +1437,8 @@ class ApRESSingleBurstFrame(tk.Frame, ApplicationReference):
         self.fileView.grid(row=4, column=0, columnspan=3, padx=8, pady=8, sticky=(tk.N + tk.E + tk.S + tk.W))
 
         self.fileView.bind("<Double-1>", self.load_from_fieldview)
+        # Row id, modified time and size for each file currently listed
+        self.file_tree_state = {}
 
         vsb = tk.Scrollbar(self.fileView, orient="vertical", command=self.fileView.yview)
         vsb.place(relx=0.978, rely=0, relheight=1, relwidth=0.020)
@@ -987,37 +1476,58 @@ class ApRESSingleBurstFrame(tk.Frame, ApplicationReference):
         self.update_file_tree()
 
     def update_file_tree(self):
-        
-        for child in self.fileView.get_children():
-            self.fileView.delete(child)
+        """Update file list with data files in survey path
+
+        Only rows for files which have been added, removed or modified since 
+        the last update are changed.
+        """
 
-        path = pathlib.Path(self.pathVar.get())
+        path = self.pathVar.get()
 
-        filenames = []
-        file_dates = []
+        # List of (filename, modified time, size) for each data file
+        files = []
         
-        if path.is_dir():
-            print("Getting files from {:s}".format(str(path)))
-            for f in os.listdir(path):
-                f_path = pathlib.Path(path / f)
-                if f_path.is_file() \
-                and os.path.splitext(f)[1].lower() == ".dat":
-                    print("Adding {:s}".format(f))
-                    file_dates.append(f_path.stat().st_mtime)
-                    filenames.append(f_path)
-                    # self.fileView.insert("", tk.END, values=(
-                    #     f, 
-                    #     datetime.datetime.fromtimestamp(f_path.stat().st_mtime)))
-
-        # Sort array
-        sort_idx = np.argsort(file_dates)
-
-        for k in reversed(sort_idx):
-            self.fileView.insert("", tk.END, values=(
-                filenames[k].name, 
-                datetime.datetime.fromtimestamp(file_dates[k]),
-                filenames[k].stat().st_size
-            ))
+        if os.path.isdir(path):
+            logger.debug("Getting files from %s", path)
+            # Single directory scan, with one stat per file
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_file() \
+                    and os.path.splitext(entry.name)[1].lower() == ".dat":
+                        logger.debug("Adding %s", entry.name)
+                        f_stat = entry.stat()
+                        files.append((entry.name, f_stat.st_mtime, f_stat.st_size))
+
+        # Sort newest first
+        files.sort(key=lambda f: f[1], reverse=True)
+
+        # Delete rows for files which no longer exist
+        names = set(f[0] for f in files)
+        removed = [name for name in self.file_tree_state if name not in names]
+        if len(removed) > 0:
+            self.fileView.delete(*[self.file_tree_state.pop(name)[0] for name in removed])
+
+        # Insert rows for new files and update rows for modified files
+        order = []
+        for f_name, f_mtime, f_size in files:
+            values = (
+                f_name, 
+                datetime.datetime.fromtimestamp(f_mtime).strftime(DatetimeVar.DATETIME_FORMAT),
+                f_size
+            )
+            if f_name not in self.file_tree_state:
+                iid = self.fileView.insert("", tk.END, values=values)
+            else:
+                iid, s_mtime, s_size = self.file_tree_state[f_name]
+                if (s_mtime, s_size) != (f_mtime, f_size):
+                    self.fileView.item(iid, values=values)
+            self.file_tree_state[f_name] = (iid, f_mtime, f_size)
+            order.append(iid)
+
+        # Reorder only if needed
+        if tuple(order) != self.fileView.get_children():
+            for index, iid in enumerate(order):
+                self.fileView.move(iid, "", index)
 
     def do_burst(self):
         """Do burst using current settings
@@ -1040,11 +1550,15 @@ class ApRESSingleBurstFrame(tk.Frame, ApplicationReference):
 
             saved_path = pathlib.Path(saved_to)
 
-            self.fileView.insert("", 0, values=(
+            f_stat = saved_path.stat()
+            if saved_path.name in self.file_tree_state:
+                self.fileView.delete(self.file_tree_state[saved_path.name][0])
+            iid = self.fileView.insert("", 0, values=(
                 saved_path.name,
-                datetime.datetime.now(),
-                saved_path.stat().st_size
+                datetime.datetime.fromtimestamp(f_stat.st_mtime).strftime(DatetimeVar.DATETIME_FORMAT),
+                f_stat.st_size
             ))
+            self.file_tree_state[saved_path.name] = (iid, f_stat.st_mtime, f_stat.st_size)
 
             # Reset button
             self.button['state'] = "normal"
@@ -1061,47 +1575,97 @@ class ApRESSingleBurstFrame(tk.Frame, ApplicationReference):
         self.load_data(filename)
 
     def load_data(self, filename):
-        
-        # Load data
+        """Load and plot burst data file
+
+        Reading and range processing are done on the application's processing
+        worker thread, and the results plotted once complete.
+
+        :param filename: path to burst data file
+        :type filename: str or pathlib.Path
+        """
+        future = self.getApplication().processingExecutor.submit(
+            self.read_data, filename, self.chirpDataControls.erIceCached
+        )
+        self.getApplication().whenDone(future, self.plot_data)
+
+    @staticmethod
+    def read_data(filename, erIce):
+        """Read burst data file and calculate range profile, ready to plot
+
+        Called on a worker thread, so must not access any Tk objects.
+
+        :param filename: path to burst data file
+        :type filename: str or pathlib.Path
+        :param erIce: relative permittivity of ice for range axis
+        :type erIce: float
+        :return: chirp time, chirp voltage, range axis and range profile 
+            magnitude (dB)
+        :rtype: tuple
+        """
         burst_data = apyres.read(filename, skip_burst=False)
-        # Clear figures
-        self.dataFigureChirpAx.clear()
-        self.dataFigureFFTAx.clear()
 
-        # Plot chirp data
-        self.dataFigureChirpAx.plot(
+        # Single precision is sufficient for plotting and range processing
+        chirp_voltage = burst_data.chirp_voltage.astype(np.float32, copy=False)
+
+        # Calculate range profile, with a new magnitude array for each file
+        # so no array in use by plotted lines is overwritten
+        rp = rangeProfile(chirp_voltage)
+
+        return (
             burst_data.chirp_time(), 
-            burst_data.chirp_voltage.transpose()
+            chirp_voltage, 
+            rangeAxis(burst_data.fmcw_parameters.B, rp.shape[-1], erIce),
+            rangeProfileDB(rp)
         )
 
-        # Calculate range profile
-        rp = apyres.RangeProfile.calculate_from_chirp([], burst_data.chirp_voltage, burst_data.fmcw_parameters)
-        dR = 3e8/(2*burst_data.fmcw_parameters.B*2*np.sqrt(self.chirpDataControls.erIceValue.get()))
-        self.dataFigureFFTAx.plot(
-            np.arange(0, dR*(rp.shape[1]), dR),
-            20*np.log10(np.abs(rp.transpose()))
+    def plot_data(self, future):
+        """Plot burst data once read by worker thread
+
+        :param future: result of read_data
+        :type future: concurrent.futures.Future
+        """
+        try:
+            chirp_time, chirp_voltage, range_axis, range_db = future.result()
+        except Exception as e:
+            tkmsg.showerror(title=type(e).__name__, message=str(e))
+            return
+
+        # Plot chirp data
+        self.dataChirpCollection = updateCollection(
+            self.dataFigureChirpAx,
+            self.dataChirpCollection,
+            chirp_time, 
+            chirp_voltage
         )
 
-        # Set title
-        self.dataFigureChirpAx.set_title('Raw Chirp Data')
-        self.dataFigureChirpAx.set_xlim([
-            self.chirpDataControls.timeMin.get(),
-            self.chirpDataControls.timeMax.get()
-        ])
-        self.dataFigureChirpAx.set_xlabel("Time (s)")
-        self.dataFigureChirpAx.set_ylabel("Voltage (V)")
+        # Plot range profile
+        self.dataFFTCollection = updateCollection(
+            self.dataFigureFFTAx,
+            self.dataFFTCollection,
+            range_axis,
+            range_db
+        )
 
-        self.dataFigureFFTAx.set_title('Chirp Range Data')
-        self.dataFigureFFTAx.set_xlim([
-            self.chirpDataControls.rangeMin.get(),
-            self.chirpDataControls.rangeMax.get()
-        ])
-        self.dataFigureFFTAx.set_xlabel("Range (m)")
-        self.dataFigureFFTAx.set_ylabel("Voltage (dBV)")
+        # Only rescale if data no longer fits, x-limits are set from controls
+        for ax in (self.dataFigureChirpAx, self.dataFigureFFTAx):
+            autoscaleIfOutside(ax, scalex=False)
+
+        # Set limits
+        setXLim(self.dataFigureChirpAx, (
+            self.chirpDataControls.timeMinCached,
+            self.chirpDataControls.timeMaxCached
+        ))
+        setXLim(self.dataFigureFFTAx, (
+            self.chirpDataControls.rangeMinCached,
+            self.chirpDataControls.rangeMaxCached
+        ))
 
-        self.dataFigureCanvas.draw()
+        self.dataFigureCanvas.redraw()
 
 class ApRESSurveyApplication(tk.Tk):
+
+    # Interval (ms) to check for completion of worker tasks
+    FUTURE_POLL_INTERVAL = 50
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -1109,6 +1673,12 @@ class ApRESSurveyApplication(tk.Tk):
         self.geometry("1200x800")
         self.api = None
 
+        # Workers for data processing and radar I/O off the Tk main thread.
+        # Radar I/O has a single worker, so requests to the radar (e.g. 
+        # config upload then reset) complete in the order they are made
+        self.processingExecutor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self.ioExecutor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
         self.systemFrame = ApRESSystemFrame(self, app=self)
         # self.systemFrame.pack(expand=1, fill=tk.BOTH)
         self.systemFrame.grid(row=0, column=0, sticky=(tk.W + tk.N + tk.S))
@@ -1118,10 +1688,14 @@ class ApRESSurveyApplication(tk.Tk):
         
         # Trial burst frame
         self.trialBurstFrame = ApRESTrialBurstFrame(self.resultsBook, app=self)
-        self.singleBurstFrame = ApRESSingleBurstFrame(self.resultsBook, app=self)
+        # Single burst frame (and its figure) is only created when its tab
+        # is first shown, so add placeholder tab for now
+        self.singleBurstFrame = None
+        self.singleBurstTab = ttk.Frame(self.resultsBook)
         
         self.resultsBook.add(self.trialBurstFrame, text="Trial Burst")
-        self.resultsBook.add(self.singleBurstFrame, text="Single Burst")
+        self.resultsBook.add(self.singleBurstTab, text="Single Burst")
+        self.resultsBook.bind("<<NotebookTabChanged>>", self.resultsTabChanged)
 
         self.columnconfigure(0, weight=0, minsize=200)
         self.columnconfigure(1, weight=4)
@@ -1141,6 +1715,36 @@ class ApRESSurveyApplication(tk.Tk):
 
         menubar.add_cascade(label="File",menu=file_menu)
 
+    def resultsTabChanged(self, *args):
+        """Create single burst frame when its tab is first selected
+        """
+        if self.singleBurstFrame == None \
+        and self.resultsBook.select() == str(self.singleBurstTab):
+            self.singleBurstFrame = ApRESSingleBurstFrame(self.singleBurstTab, app=self)
+            self.singleBurstFrame.pack(expand=1, fill=tk.BOTH)
+
+    def destroy(self):
+        # Close the window without waiting on outstanding processing or I/O.
+        # Worker threads are still joined at interpreter exit, so a radar 
+        # request in progress delays the process exiting until it returns
+        # or times out
+        self.processingExecutor.shutdown(wait=False)
+        self.ioExecutor.shutdown(wait=False)
+        super().destroy()
+
+    def whenDone(self, future, callback, *args):
+        """Call callback on the Tk main thread once future completes
+
+        :param future: future to wait on
+        :type future: concurrent.futures.Future
+        :param callback: called as callback(future, *args)
+        :type callback: callable
+        """
+        if future.done():
+            callback(future, *args)
+        else:
+            self.after(self.FUTURE_POLL_INTERVAL, self.whenDone, future, callback, *args)
+
     def setAPIKey(self, *args):
         key = tkdlg.askstring(title="Set API Key", prompt="Enter API Key:")
         if key != None or len(key) > 0:
@@ -1150,5 +1754,13 @@ class ApRESSurveyApplication(tk.Tk):
             tkmsg.showwarning(title="Empty API Key", message="No API key entered.  Some functionality may not work.")
 
 if __name__ == "__main__":
+    # Fall back to WARNING if level name is not recognised
+    logLevel = getattr(logging, os.environ.get("APRESSURVEY_LOG_LEVEL", "").upper(), None)
+    if not isinstance(logLevel, int):
+        logLevel = logging.WARNING
+    logging.basicConfig(
+        level=logLevel,
+        format="%(asctime)s %(name)s %(levelname)s: %(message)s"
+    )
     app = ApRESSurveyApplication()
     app.mainloop()
\ No newline at end of file
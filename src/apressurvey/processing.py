@@ -0,0 +1,105 @@
+# Range processing of ApRES chirp data, independent of the GUI
+import numpy as np
+
+# Use scipy's FFT if available, which preserves single precision and can
+# batch transforms over multiple threads
+try:
+    import scipy.fft as fft
+    FFT_KWARGS = {'workers' : -1}
+except ImportError:
+    import numpy.fft as fft
+    FFT_KWARGS = {}
+
+# Use numexpr if available to calculate dB magnitudes in a single pass
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+def rangeProfile(chirps, padding=2):
+    """
+    Calculate range profile of real-valued chirps
+
+    The mean of each chirp is removed, so any DC offset does not leak into
+    near range bins.  Chirps are then Blackman windowed and zero padded 
+    before a real FFT along the last axis, so only the non-redundant 
+    positive frequencies are computed.  The Blackman window and scaling 
+    follow the usual ApRES processing convention.  FMCW parameters are not 
+    needed here, only to build the range axis, for which the padding factor
+    should match.
+
+    :param chirps: chirp voltages, one chirp per row, with any number of 
+        leading axes (e.g. bursts)
+    :type chirps: numpy.ndarray
+    :param padding: zero padding factor, defaults to 2
+    :type padding: int, optional
+    :return: complex range profile, one row per chirp
+    :rtype: numpy.ndarray
+    """
+    N = chirps.shape[-1]
+    nfft = padding * N
+    # Work in floating point, even if chirps are integer samples
+    dtype = np.result_type(chirps.dtype, np.float32)
+    window = np.blackman(N).astype(dtype, copy=False)
+    # Scale for zero padding and window power
+    scale = np.sqrt(2 * padding) / nfft / np.sqrt(np.mean(window ** 2))
+
+    # Remove mean of each chirp, then window in place
+    chirps = chirps - chirps.mean(axis=-1, keepdims=True, dtype=dtype)
+    chirps *= window
+
+    rp = fft.rfft(chirps, n=nfft, axis=-1, **FFT_KWARGS)[..., :nfft // 2]
+    rp *= scale
+    return rp
+
+def rangeAxis(B, N, erIce, padding=2):
+    """
+    Calculate range axis in ice for a range profile
+
+    :param B: chirp bandwidth (Hz)
+    :type B: float
+    :param N: number of range bins
+    :type N: int
+    :param erIce: relative permittivity of ice
+    :type erIce: float
+    :param padding: zero padding factor used in rangeProfile, defaults to 2
+    :type padding: int, optional
+    :return: range of each bin (m)
+    :rtype: numpy.ndarray
+    """
+    dR = 3e8/(2*B*padding*np.sqrt(erIce))
+    return np.linspace(0.0, dR*(N-1), N, dtype=np.float32)
+
+def rangeProfileDB(rp, out=None):
+    """
+    Calculate magnitude of range profile in dB
+
+    Computed in place in a single output buffer, avoiding intermediate 
+    arrays, and in a single fused pass if numexpr is available.  Magnitudes
+    are clamped at -300 dB to avoid -inf for empty bins.
+
+    :param rp: complex range profile
+    :type rp: numpy.ndarray
+    :param out: buffer to reuse, reallocated if None or of the wrong shape
+        or dtype, defaults to None
+    :type out: numpy.ndarray, optional
+    :return: range profile magnitude (dB)
+    :rtype: numpy.ndarray
+    """
+    dtype = np.finfo(rp.dtype).dtype
+    if out is None or out.shape != rp.shape or out.dtype != dtype:
+        out = np.empty(rp.shape, dtype=dtype)
+
+    if numexpr is not None and np.iscomplexobj(rp):
+        numexpr.evaluate(
+            "10*log10(where(re**2 + im**2 > 1e-30, re**2 + im**2, 1e-30))",
+            local_dict={'re' : rp.real, 'im' : rp.imag},
+            out=out,
+            casting='unsafe'
+        )
+    else:
+        np.abs(rp, out=out)
+        np.maximum(out, 1e-15, out=out)
+        np.log10(out, out=out)
+        out *= 20
+    return out
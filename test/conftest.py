@@ -0,0 +1,5 @@
+import pathlib
+import sys
+
+# Import apressurvey from the source tree, without it being installed
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent / "src"))
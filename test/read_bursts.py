@@ -1,5 +1,9 @@
 import apreshttp
 import apyres
+from apressurvey.processing import rangeProfile
+import asyncio
+import concurrent.futures
+import functools
 import numpy as np
 import matplotlib.pyplot as plt
 import tempfile
@@ -9,31 +13,50 @@ tmp_dir = tempfile.TemporaryDirectory()
 apres = apreshttp.API("http://192.168.1.1")
 apres.setKey("18052021")
 
-burst_data = []
-data = []
+num_bursts = 10
 
-for k in range(10):
+async def process_burst(loop, io_pool, cpu_pool, filename):
+    """Download and read a single burst"""
 
-    apres.radar.burst()
-    results = apres.radar.results()
+    print("Downloading {:s} to {:s}".format(filename, tmp_dir.name))
+    saved_to = await loop.run_in_executor(io_pool, apres.data.download, filename, tmp_dir.name)
 
-    print("Finished burst, got results with filename {:s}".format(results.filename))
+    return await loop.run_in_executor(cpu_pool, functools.partial(apyres.read, saved_to, skip_burst=False))
 
-    print("Downloading to {:s}".format(tmp_dir.name))
-    saved_to = apres.data.download(results.filename, tmp_dir.name);
+async def collect_bursts():
+    """Burst serially, downloading and reading each burst while the radar
+    collects the next one"""
 
-    burst_data.append(apyres.read(saved_to, skip_burst=False))
-    plt.show()
+    loop = asyncio.get_running_loop()
 
-    rp = apyres.RangeProfile.calculate_from_chirp([], burst_data[k].chirp_voltage, burst_data[k].fmcw_parameters)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as radar_pool, \
+         concurrent.futures.ThreadPoolExecutor(max_workers=1) as io_pool, \
+         concurrent.futures.ThreadPoolExecutor(max_workers=1) as cpu_pool:
 
-    if len(data) == 0:
-        data = rp
-    else:
-        data = np.vstack((data, rp));
+        tasks = []
 
-    plt.imshow(np.abs(data.transpose()),aspect='auto')
-    plt.show()
+        for k in range(num_bursts):
 
+            await loop.run_in_executor(radar_pool, apres.radar.burst)
+            results = await loop.run_in_executor(radar_pool, apres.radar.results)
 
-print("Finished")
\ No newline at end of file
+            print("Finished burst, got results with filename {:s}".format(results.filename))
+
+            tasks.append(asyncio.ensure_future(
+                process_burst(loop, io_pool, cpu_pool, results.filename)
+            ))
+
+        return await asyncio.gather(*tasks)
+
+burst_data = asyncio.run(collect_bursts())
+
+# Range process the chirps of all bursts with a single batched FFT
+rp = rangeProfile(np.stack([burst.chirp_voltage for burst in burst_data]))
+
+# One row per chirp, bursts in order
+data = rp.reshape(-1, rp.shape[-1])
+
+plt.imshow(np.abs(data.transpose()),aspect='auto')
+plt.show()
+
+print("Finished")
@@ -0,0 +1,121 @@
+import numpy as np
+import numpy.fft
+import pathlib
+import pytest
+from apressurvey import processing
+from apressurvey.processing import rangeAxis, rangeProfile, rangeProfileDB
+
+# Peak magnitude of a unit amplitude tone for padding of 2, from the
+# coherent gain (0.42) and mean square (0.3046) of the Blackman window
+UNIT_TONE_PEAK = 0.3805
+UNIT_TONE_PEAK_DB = -8.39
+
+# Recorded bursts to compare against apyres, if available
+DATA_FILES = sorted((pathlib.Path(__file__).parent / "data").glob("*.dat"))
+
+@pytest.fixture(autouse=True, params=["numpy", "scipy"])
+def fftBackend(request, monkeypatch):
+    """Run each test with both the numpy and (if installed) scipy FFT"""
+    if request.param == "scipy":
+        monkeypatch.setattr(processing, "fft", pytest.importorskip("scipy.fft"))
+        monkeypatch.setattr(processing, "FFT_KWARGS", {'workers' : -1})
+    else:
+        monkeypatch.setattr(processing, "fft", numpy.fft)
+        monkeypatch.setattr(processing, "FFT_KWARGS", {})
+    return request.param
+
+@pytest.fixture(params=["numpy", "numexpr"])
+def dbBackend(request, monkeypatch):
+    """Run dB tests with both numpy and (if installed) numexpr"""
+    if request.param == "numexpr":
+        monkeypatch.setattr(processing, "numexpr", pytest.importorskip("numexpr"))
+    else:
+        monkeypatch.setattr(processing, "numexpr", None)
+    return request.param
+
+def tone(N, k, amplitude=1.0):
+    """Chirp with a single beat frequency of k cycles per chirp"""
+    return amplitude * np.cos(2 * np.pi * k * np.arange(N) / N)
+
+def test_range_profile_single_tone():
+    N, k, amplitude = 4000, 300, 0.5
+    rp = rangeProfile(tone(N, k, amplitude)[np.newaxis, :])
+
+    assert rp.shape == (1, N)
+    # Zero padding interpolates, so the tone lands on bin 2 * k
+    assert np.argmax(np.abs(rp[0])) == 2 * k
+    np.testing.assert_allclose(np.abs(rp[0, 2 * k]), amplitude * UNIT_TONE_PEAK, rtol=2e-3)
+
+def test_range_profile_dc_offset():
+    N, k = 4000, 300
+    chirps = tone(N, k)[np.newaxis, :]
+    rp = rangeProfile(chirps + 0.3)
+
+    # Offset is removed, so near range bins are unaffected
+    np.testing.assert_allclose(rp, rangeProfile(chirps), atol=1e-9)
+    assert np.all(np.abs(rp[0, :8]) < 1e-6)
+
+def test_range_profile_batched():
+    chirps = np.stack([
+        np.stack([tone(1000, 50 + 10 * burst + chirp) for chirp in range(3)])
+        for burst in range(2)
+    ])
+    rp = rangeProfile(chirps)
+
+    assert rp.shape == (2, 3, 1000)
+    np.testing.assert_allclose(rp[1, 2], rangeProfile(chirps[1, 2]))
+
+def test_range_profile_integer_samples():
+    chirps = np.round(1000 * tone(1000, 50)).astype(np.int16)[np.newaxis, :]
+    rp = rangeProfile(chirps)
+
+    assert np.iscomplexobj(rp)
+    np.testing.assert_allclose(
+        rp, rangeProfile(chirps.astype(np.float64)), rtol=1e-4, atol=1e-3
+    )
+
+def test_range_profile_single_precision():
+    rp = rangeProfile(tone(1000, 50).astype(np.float32)[np.newaxis, :])
+
+    assert np.iscomplexobj(rp)
+    np.testing.assert_allclose(np.abs(rp[0, 100]), UNIT_TONE_PEAK, rtol=2e-3)
+
+def test_range_profile_db(dbBackend):
+    rp = np.array([[1.0, 0.1, 0.0]], dtype=np.complex64)
+    rp_db = rangeProfileDB(rp)
+
+    assert rp_db.dtype == np.float32
+    np.testing.assert_allclose(rp_db[0, :2], [0.0, -20.0], atol=1e-4)
+    assert np.isfinite(rp_db[0, 2])
+
+def test_range_profile_db_single_tone(dbBackend):
+    rp_db = rangeProfileDB(rangeProfile(tone(4000, 300)[np.newaxis, :]))
+
+    np.testing.assert_allclose(rp_db[0, 600], UNIT_TONE_PEAK_DB, atol=0.02)
+
+def test_range_profile_db_reuses_buffer(dbBackend):
+    rp = rangeProfile(tone(1000, 50)[np.newaxis, :])
+    out = np.empty(rp.shape, dtype=np.float64)
+
+    assert rangeProfileDB(rp, out) is out
+
+def test_range_axis():
+    # 200 MHz bandwidth in ice (er = 3.18), padded by 2
+    axis = rangeAxis(200e6, 1000, 3.18)
+
+    assert axis.shape == (1000,)
+    assert axis[0] == 0
+    np.testing.assert_allclose(np.diff(axis), 0.2103, rtol=1e-3)
+
+@pytest.mark.parametrize("filename", DATA_FILES, ids=[f.name for f in DATA_FILES])
+def test_range_profile_matches_apyres(filename):
+    apyres = pytest.importorskip("apyres")
+    burst = apyres.read(str(filename), skip_burst=False)
+
+    expected = apyres.RangeProfile.calculate_from_chirp(
+        [], burst.chirp_voltage, burst.fmcw_parameters
+    )
+    rp = rangeProfile(burst.chirp_voltage)
+
+    assert rp.shape == expected.shape
+    np.testing.assert_allclose(np.abs(rp), np.abs(expected), rtol=1e-3, atol=1e-9)